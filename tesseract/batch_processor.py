@@ -2,57 +2,386 @@
 Batch Processing Module for OCR Application
 """
 import os
+import csv
 import json
-import pandas as pd
-from pathlib import Path
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import functools
+from typing import List, Dict, Any, Optional, Iterator, Tuple, Type, Callable
+from concurrent.futures import (BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor,
+                                FIRST_COMPLETED, wait)
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 
-from ocr_engine import OCRApp, OCREngine, OCRResult, VerificationResult
+import ocr_engine
+from ocr_engine import OCRApp, OCREngine, OCRResult, VerificationResult, _init_worker
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+CSV_FIELDS = [
+    'image_path', 'success', 'error', 'timestamp',
+    'engine', 'confidence', 'processing_time', 'text_length',
+    'items_count', 'total_detected', 'calculated_sum', 'matches', 'difference',
+]
+
+SUMMARY_HEADERS = ('Image', 'Success', 'Error', 'Engine', 'Confidence', 'Items Count', 'Total Detected', 'Matches')
+
+DETAILED_HEADERS = ('Image', 'Text', 'Processing Time', 'Items', 'Total', 'Calculated Sum', 'Verification Result')
+
+
+def _flatten_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a result into a flat CSV row"""
+    row = {
+        'image_path': result.get('image_path', ''),
+        'success': result.get('success', False),
+        'error': result.get('error', ''),
+        'timestamp': result.get('timestamp', ''),
+    }
+    
+    if result.get('ocr_result'):
+        ocr = result['ocr_result']
+        row.update({
+            'engine': ocr.engine.value,
+            'confidence': ocr.confidence,
+            'processing_time': ocr.processing_time,
+            'text_length': len(ocr.text)
+        })
+    
+    if result.get('verification'):
+        ver = result['verification']
+        row.update({
+            'items_count': len(ver.items),
+            'total_detected': ver.total.value if ver.total else None,
+            'calculated_sum': ver.calculated_sum,
+            'matches': ver.matches,
+            'difference': ver.difference
+        })
+    
+    return row
+
+
+def _new_columns() -> Dict[str, list]:
+    """Empty column buffers for the flat (CSV/Parquet) layout"""
+    return {field: [] for field in CSV_FIELDS}
+
+
+def _append_columns(columns: Dict[str, list], result: Dict[str, Any]):
+    """Append a flattened result to column buffers"""
+    row = _flatten_result(result)
+    for field, values in columns.items():
+        values.append(row.get(field))
+
+
+def _require_pyarrow():
+    """Raise ImportError if Parquet output is unavailable (checked before any OCR work)"""
+    if not PYARROW_AVAILABLE:
+        raise ImportError("Parquet output requires pyarrow. Install with: pip install pyarrow")
+
+
+def _write_parquet(columns: Dict[str, list], output_path: str):
+    """Write column buffers as a Parquet file via an Arrow table"""
+    _require_pyarrow()
+    pq.write_table(pa.table(columns), output_path)
+
+
+def _summary_row(result: Dict[str, Any]) -> tuple:
+    """Build a row for the Excel 'Summary' sheet"""
+    ocr = result.get('ocr_result')
+    ver = result.get('verification')
+    return (
+        os.path.basename(result.get('image_path', '')),
+        result.get('success', False),
+        result.get('error', ''),
+        ocr.engine.value if ocr else '',
+        ocr.confidence if ocr else 0,
+        len(ver.items) if ver else 0,
+        ver.total.value if ver and ver.total else '',
+        ver.matches if ver else False,
+    )
+
+
+def _detailed_row(result: Dict[str, Any]) -> Optional[tuple]:
+    """Build a row for the Excel 'Detailed Results' sheet, or None if not applicable"""
+    ocr = result.get('ocr_result')
+    if not (result.get('success') and ocr):
+        return None
+    ver = result.get('verification')
+    return (
+        os.path.basename(result.get('image_path', '')),
+        ocr.text,
+        ocr.processing_time,
+        str([item.value for item in ver.items]) if ver else '',
+        ver.total.value if ver and ver.total else '',
+        ver.calculated_sum if ver else '',
+        ver.matches if ver else '',
+    )
+
+
+def _new_excel_workbook():
+    """Create a write-only workbook with the 'Summary' and 'Detailed Results' sheets"""
+    import openpyxl
+    
+    workbook = openpyxl.Workbook(write_only=True)
+    ws_summary = workbook.create_sheet('Summary')
+    ws_summary.append(SUMMARY_HEADERS)
+    ws_detailed = workbook.create_sheet('Detailed Results')
+    ws_detailed.append(DETAILED_HEADERS)
+    return workbook, ws_summary, ws_detailed
+
+
+class SummaryAccumulator:
+    """Running batch statistics, updated one result at a time"""
+    
+    def __init__(self):
+        self.total_images = 0
+        self.successful = 0
+        self.ocr_count = 0
+        self.confidence_sum = 0.0
+        self.processing_time_sum = 0.0
+        self.total_verifications = 0
+        self.successful_verifications = 0
+    
+    def add(self, result: Dict[str, Any]):
+        """Fold a single result into the running totals"""
+        result_get = result.get
+        self.total_images += 1
+        if result_get('success', False):
+            self.successful += 1
+        
+        ocr = result_get('ocr_result')
+        if ocr:
+            self.ocr_count += 1
+            self.confidence_sum += ocr.confidence
+            self.processing_time_sum += ocr.processing_time
+        
+        ver = result_get('verification')
+        if ver:
+            self.total_verifications += 1
+            if ver.matches:
+                self.successful_verifications += 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return statistics in the same shape as BatchProcessor.get_summary_statistics"""
+        if not self.total_images:
+            return {}
+        
+        return {
+            'total_images': self.total_images,
+            'successful_processing': self.successful,
+            'failed_processing': self.total_images - self.successful,
+            'success_rate': self.successful / self.total_images,
+            'average_confidence': self.confidence_sum / self.ocr_count if self.ocr_count else 0,
+            'average_processing_time': self.processing_time_sum / self.ocr_count if self.ocr_count else 0,
+            'total_verifications': self.total_verifications,
+            'successful_verifications': self.successful_verifications,
+            'verification_success_rate': self.successful_verifications / self.total_verifications if self.total_verifications > 0 else 0
+        }
+
+
+def _timestamp(clock: Optional[Tuple[datetime, float]] = None) -> str:
+    """ISO timestamp, derived from a (batch_started, monotonic_t0) anchor when given"""
+    if clock is None:
+        return datetime.now().isoformat()
+    batch_started, t0 = clock
+    return (batch_started + timedelta(seconds=time.monotonic() - t0)).isoformat()
+
+
+def _process_single_image(ocr_app: OCRApp, image_path: str, engine: OCREngine,
+                          clock: Optional[Tuple[datetime, float]] = None) -> Dict[str, Any]:
+    """Process a single image and return results"""
+    try:
+        result = ocr_app.process_image(image_path, engine)
+        result['image_path'] = image_path
+        result['timestamp'] = _timestamp(clock)
+        return result
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e),
+            'image_path': image_path,
+            'timestamp': _timestamp(clock),
+            'ocr_result': None,
+            'verification': None
+        }
+
+
+def _ocr_batch(ocr_app: OCRApp, image_paths: List[str],
+               clock: Optional[Tuple[datetime, float]] = None) -> List[Dict[str, Any]]:
+    """OCR a chunk of images with a single Tesseract invocation (see OCRApp.process_batch)"""
+    try:
+        results = ocr_app.process_batch(image_paths, OCREngine.TESSERACT)
+    except Exception:
+        return [_process_single_image(ocr_app, p, OCREngine.TESSERACT, clock) for p in image_paths]
+    
+    for image_path, result in zip(image_paths, results):
+        result['image_path'] = image_path
+        result['timestamp'] = _timestamp(clock)
+    return results
+
+
+def _process_chunk(ocr_app: OCRApp, image_paths: List[str], engine: OCREngine,
+                   clock: Optional[Tuple[datetime, float]] = None) -> List[Dict[str, Any]]:
+    """Process a chunk of images: one Tesseract run for multi-image chunks, else per image"""
+    if engine == OCREngine.TESSERACT and len(image_paths) > 1:
+        return _ocr_batch(ocr_app, image_paths, clock)
+    return [_process_single_image(ocr_app, p, engine, clock) for p in image_paths]
+
+
+def _process_chunk_in_worker(image_paths: List[str], engine: OCREngine,
+                             clock: Optional[Tuple[datetime, float]] = None) -> List[Dict[str, Any]]:
+    """Process a chunk with the worker-local OCRApp built by ocr_engine._init_worker"""
+    return _process_chunk(ocr_engine._WORKER_APP, image_paths, engine, clock)
 
 
 class BatchProcessor:
     """Batch processing for multiple images"""
     
-    def __init__(self, ocr_app: OCRApp, max_workers: int = 4):
+    def __init__(self, ocr_app: OCRApp, max_workers: int = 4,
+                 executor_cls: Optional[Type[Executor]] = None,
+                 tesseract_batch_size: int = 1):
         self.ocr_app = ocr_app
         self.max_workers = max_workers
+        # None selects per engine: processes for CPU-bound Tesseract, threads for network-bound Vision
+        self.executor_cls = executor_cls
+        # Images per tesseract invocation; > 1 amortizes process startup and model load
+        self.tesseract_batch_size = tesseract_batch_size
         self.results = []
     
     def process_single_image(self, image_path: str, engine: OCREngine) -> Dict[str, Any]:
         """Process a single image and return results"""
-        try:
-            result = self.ocr_app.process_image(image_path, engine)
-            result['image_path'] = image_path
-            result['timestamp'] = datetime.now().isoformat()
-            return result
-        except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'image_path': image_path,
-                'timestamp': datetime.now().isoformat(),
-                'ocr_result': None,
-                'verification': None
-            }
+        return _process_single_image(self.ocr_app, image_path, engine)
     
-    def process_directory(self, directory_path: str, engine: OCREngine = OCREngine.TESSERACT, 
-                         file_extensions: List[str] = None) -> List[Dict[str, Any]]:
-        """Process all images in a directory"""
+    def _make_executor(self, engine: OCREngine) -> Executor:
+        """Create the worker pool for the given engine"""
+        executor_cls = self.executor_cls
+        if executor_cls is None:
+            executor_cls = ProcessPoolExecutor if engine == OCREngine.TESSERACT else ThreadPoolExecutor
+        
+        if issubclass(executor_cls, ProcessPoolExecutor):
+            # Each worker process builds its own OCRApp once, with the same cache settings
+            return executor_cls(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=self.ocr_app._worker_initargs()
+            )
+        return executor_cls(max_workers=self.max_workers)
+    
+    def _task_for(self, executor: Executor) -> Callable[..., List[Dict[str, Any]]]:
+        """Task callable for the executor: worker-local app for processes, shared app for threads"""
+        if isinstance(executor, ProcessPoolExecutor):
+            return _process_chunk_in_worker
+        return functools.partial(_process_chunk, self.ocr_app)
+    
+    def _ocr_batch(self, image_paths: List[str]) -> List[Dict[str, Any]]:
+        """OCR several images with a single Tesseract invocation"""
+        return _ocr_batch(self.ocr_app, image_paths)
+    
+    def _find_image_files(self, directory_path: str, file_extensions: List[str] = None) -> List[str]:
+        """List image files in a directory with a single scandir pass"""
         if file_extensions is None:
             file_extensions = ['.png', '.jpg', '.jpeg', '.tiff', '.bmp']
         
-        directory = Path(directory_path)
-        if not directory.exists():
+        if not os.path.isdir(directory_path):
             raise FileNotFoundError(f"Directory not found: {directory_path}")
         
-        # Find all image files
+        exts = {ext.lower() for ext in file_extensions}
         image_files = []
-        for ext in file_extensions:
-            image_files.extend(directory.glob(f"*{ext}"))
-            image_files.extend(directory.glob(f"*{ext.upper()}"))
+        with os.scandir(directory_path) as it:
+            for entry in it:
+                if entry.is_file() and os.path.splitext(entry.name)[1].lower() in exts:
+                    image_files.append(entry.path)
+        return image_files
+    
+    def _iter_results(self, image_files: List[str], engine: OCREngine) -> Iterator[Dict[str, Any]]:
+        """Process images in parallel, yielding each result as it completes"""
+        # Anchor timestamps once per batch instead of calling datetime.now() per image
+        clock = (datetime.now(), time.monotonic())
+        
+        # Tesseract chunks share one process per chunk; other engines go one image per task
+        chunk_size = max(1, self.tesseract_batch_size) if engine == OCREngine.TESSERACT else 1
+        chunks = (image_files[i:i + chunk_size] for i in range(0, len(image_files), chunk_size))
+        
+        # Keep at most 2 * max_workers tasks in flight so the pending queue stays bounded
+        window = 2 * self.max_workers
+        
+        with self._make_executor(engine) as executor:
+            task = self._task_for(executor)
+            future_to_chunk = {}
+            # Set once the pool breaks (a worker process died); no more chunks are submitted
+            broken = None
+            
+            def submit_next() -> bool:
+                nonlocal broken
+                if broken is not None:
+                    return False
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return False
+                try:
+                    future = executor.submit(task, chunk, engine, clock)
+                except BrokenExecutor as e:
+                    broken = (e, [chunk, *chunks])
+                    return False
+                future_to_chunk[future] = chunk
+                return True
+            
+            for _ in range(window):
+                if not submit_next():
+                    break
+            
+            # Collect results as they complete, topping up the window
+            while future_to_chunk:
+                done, _ = wait(future_to_chunk, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = future_to_chunk.pop(future)
+                    submit_next()
+                    try:
+                        results = future.result()
+                        
+                        # Progress update
+                        for result in results:
+                            print(f"Processed: {os.path.basename(result['image_path'])} - "
+                                  f"{'Success' if result['success'] else 'Failed'}")
+                        
+                    except Exception as e:
+                        results = self._chunk_errors(chunk, e, clock)
+                    yield from results
+            
+            # Chunks the broken pool never accepted still get one error record per image
+            if broken is not None:
+                error, unsubmitted = broken
+                for chunk in unsubmitted:
+                    yield from self._chunk_errors(chunk, error, clock)
+    
+    @staticmethod
+    def _chunk_errors(chunk: List[str], error: Exception,
+                      clock: Optional[Tuple[datetime, float]] = None) -> List[Dict[str, Any]]:
+        """Failure records for every image of a chunk that could not be processed"""
+        results = []
+        for img_path in chunk:
+            print(f"Error processing {img_path}: {error}")
+            results.append({
+                'success': False,
+                'error': str(error),
+                'image_path': img_path,
+                'timestamp': _timestamp(clock)
+            })
+        return results
+    
+    def process_directory(self, directory_path: str, engine: OCREngine = OCREngine.TESSERACT, 
+                         file_extensions: List[str] = None) -> List[Dict[str, Any]]:
+        """Process all images in a directory"""
+        image_files = self._find_image_files(directory_path, file_extensions)
         
         if not image_files:
             print(f"No image files found in {directory_path}")
@@ -61,35 +390,8 @@ class BatchProcessor:
         print(f"Found {len(image_files)} images to process")
         
         # Process images in parallel
-        results = []
         start_time = time.time()
-        
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_path = {
-                executor.submit(self.process_single_image, str(img_path), engine): str(img_path)
-                for img_path in image_files
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_path):
-                img_path = future_to_path[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    
-                    # Progress update
-                    print(f"Processed: {os.path.basename(img_path)} - "
-                          f"{'Success' if result['success'] else 'Failed'}")
-                    
-                except Exception as e:
-                    print(f"Error processing {img_path}: {e}")
-                    results.append({
-                        'success': False,
-                        'error': str(e),
-                        'image_path': img_path,
-                        'timestamp': datetime.now().isoformat()
-                    })
+        results = list(self._iter_results(image_files, engine))
         
         processing_time = time.time() - start_time
         print(f"Batch processing completed in {processing_time:.2f} seconds")
@@ -97,6 +399,74 @@ class BatchProcessor:
         self.results = results
         return results
     
+    def process_directory_stream(self, directory_path: str, output_path: str, format: str = 'jsonl',
+                                 engine: OCREngine = OCREngine.TESSERACT,
+                                 file_extensions: List[str] = None) -> Dict[str, Any]:
+        """Process all images in a directory, writing each result to disk as it completes.
+        
+        Only aggregate statistics are kept in memory; ``self.results`` is left untouched.
+        Supported formats: 'jsonl', 'csv', 'excel' and 'parquet' (parquet buffers only
+        the flat scalar columns and writes them once at the end).
+        """
+        format = format.lower()
+        if format not in ('jsonl', 'csv', 'excel', 'parquet'):
+            raise ValueError(f"Unsupported streaming format: {format}")
+        if format == 'parquet':
+            _require_pyarrow()
+        
+        image_files = self._find_image_files(directory_path, file_extensions)
+        
+        if not image_files:
+            print(f"No image files found in {directory_path}")
+            return {}
+        
+        print(f"Found {len(image_files)} images to process")
+        
+        summary = SummaryAccumulator()
+        start_time = time.time()
+        
+        if format == 'excel':
+            workbook, ws_summary, ws_detailed = _new_excel_workbook()
+            try:
+                for result in self._iter_results(image_files, engine):
+                    ws_summary.append(_summary_row(result))
+                    detailed = _detailed_row(result)
+                    if detailed is not None:
+                        ws_detailed.append(detailed)
+                    summary.add(result)
+            finally:
+                workbook.save(output_path)
+        elif format == 'parquet':
+            columns = _new_columns()
+            for result in self._iter_results(image_files, engine):
+                _append_columns(columns, result)
+                summary.add(result)
+            _write_parquet(columns, output_path)
+        else:
+            with open(output_path, 'w', newline='' if format == 'csv' else None, encoding='utf-8') as f:
+                if format == 'csv':
+                    writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+                    writer.writeheader()
+                else:
+                    writer = f
+                for result in self._iter_results(image_files, engine):
+                    self._write_record(writer, result)
+                    summary.add(result)
+        
+        processing_time = time.time() - start_time
+        print(f"Batch processing completed in {processing_time:.2f} seconds")
+        print(f"Results saved to {output_path}")
+        
+        return summary.to_dict()
+    
+    def _write_record(self, writer, result: Dict[str, Any]):
+        """Append a single result to an open JSON-lines file or CSV writer"""
+        if isinstance(writer, csv.DictWriter):
+            writer.writerow(_flatten_result(result))
+        else:
+            json.dump(result, writer, ensure_ascii=False, default=str)
+            writer.write('\n')
+    
     def save_results(self, output_path: str, format: str = 'json'):
         """Save batch processing results"""
         if not self.results:
@@ -109,123 +479,65 @@ class BatchProcessor:
             self._save_csv(output_path)
         elif format.lower() == 'excel':
             self._save_excel(output_path)
+        elif format.lower() == 'parquet':
+            self._save_parquet(output_path)
         else:
             raise ValueError(f"Unsupported format: {format}")
     
     def _save_json(self, output_path: str):
         """Save results as JSON"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False, default=str)
+        if ORJSON_AVAILABLE:
+            # Dataclasses and datetimes go through default=str, matching the stdlib output
+            data = orjson.dumps(
+                self.results,
+                default=str,
+                option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                        | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME)
+            )
+            with open(output_path, 'wb') as f:
+                f.write(data)
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(self.results, f, indent=2, ensure_ascii=False, default=str)
         print(f"Results saved to {output_path}")
     
     def _save_csv(self, output_path: str):
         """Save results as CSV"""
-        # Flatten results for CSV
-        flattened_data = []
-        
-        for result in self.results:
-            row = {
-                'image_path': result.get('image_path', ''),
-                'success': result.get('success', False),
-                'error': result.get('error', ''),
-                'timestamp': result.get('timestamp', ''),
-            }
-            
-            if result.get('ocr_result'):
-                ocr = result['ocr_result']
-                row.update({
-                    'engine': ocr.engine.value,
-                    'confidence': ocr.confidence,
-                    'processing_time': ocr.processing_time,
-                    'text_length': len(ocr.text)
-                })
-            
-            if result.get('verification'):
-                ver = result['verification']
-                row.update({
-                    'items_count': len(ver.items),
-                    'total_detected': ver.total.value if ver.total else None,
-                    'calculated_sum': ver.calculated_sum,
-                    'matches': ver.matches,
-                    'difference': ver.difference
-                })
-            
-            flattened_data.append(row)
-        
-        df = pd.DataFrame(flattened_data)
-        df.to_csv(output_path, index=False, encoding='utf-8')
+        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for result in self.results:
+                writer.writerow(_flatten_result(result))
         print(f"Results saved to {output_path}")
     
     def _save_excel(self, output_path: str):
         """Save results as Excel with multiple sheets"""
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            # Summary sheet
-            summary_data = []
-            for result in self.results:
-                summary_data.append({
-                    'Image': os.path.basename(result.get('image_path', '')),
-                    'Success': result.get('success', False),
-                    'Error': result.get('error', ''),
-                    'Engine': result.get('ocr_result', {}).get('engine', {}).get('value', '') if result.get('ocr_result') else '',
-                    'Confidence': result.get('ocr_result', {}).get('confidence', 0) if result.get('ocr_result') else 0,
-                    'Items Count': len(result.get('verification', {}).get('items', [])) if result.get('verification') else 0,
-                    'Total Detected': result.get('verification', {}).get('total', {}).get('value', '') if result.get('verification') and result.get('verification', {}).get('total') else '',
-                    'Matches': result.get('verification', {}).get('matches', False) if result.get('verification') else False
-                })
-            
-            df_summary = pd.DataFrame(summary_data)
-            df_summary.to_excel(writer, sheet_name='Summary', index=False)
-            
-            # Detailed results sheet
-            detailed_data = []
-            for result in self.results:
-                if result.get('success') and result.get('ocr_result'):
-                    detailed_data.append({
-                        'Image': os.path.basename(result.get('image_path', '')),
-                        'Text': result.get('ocr_result', {}).get('text', ''),
-                        'Processing Time': result.get('ocr_result', {}).get('processing_time', 0),
-                        'Items': str([item.value for item in result.get('verification', {}).get('items', [])]) if result.get('verification') else '',
-                        'Total': result.get('verification', {}).get('total', {}).get('value', '') if result.get('verification') and result.get('verification', {}).get('total') else '',
-                        'Calculated Sum': result.get('verification', {}).get('calculated_sum', '') if result.get('verification') else '',
-                        'Verification Result': result.get('verification', {}).get('matches', '') if result.get('verification') else ''
-                    })
-            
-            if detailed_data:
-                df_detailed = pd.DataFrame(detailed_data)
-                df_detailed.to_excel(writer, sheet_name='Detailed Results', index=False)
+        workbook, ws_summary, ws_detailed = _new_excel_workbook()
+        
+        for result in self.results:
+            ws_summary.append(_summary_row(result))
+            detailed = _detailed_row(result)
+            if detailed is not None:
+                ws_detailed.append(detailed)
         
+        workbook.save(output_path)
+        print(f"Results saved to {output_path}")
+    
+    def _save_parquet(self, output_path: str):
+        """Save results as Parquet"""
+        columns = _new_columns()
+        for result in self.results:
+            _append_columns(columns, result)
+        _write_parquet(columns, output_path)
         print(f"Results saved to {output_path}")
     
     def get_summary_statistics(self) -> Dict[str, Any]:
         """Get summary statistics from batch processing"""
-        if not self.results:
-            return {}
-        
-        total_images = len(self.results)
-        successful = sum(1 for r in self.results if r.get('success', False))
-        failed = total_images - successful
-        
-        # OCR statistics
-        ocr_results = [r for r in self.results if r.get('ocr_result')]
-        avg_confidence = sum(r['ocr_result'].confidence for r in ocr_results) / len(ocr_results) if ocr_results else 0
-        avg_processing_time = sum(r['ocr_result'].processing_time for r in ocr_results) / len(ocr_results) if ocr_results else 0
-        
-        # Verification statistics
-        verifications = [r for r in self.results if r.get('verification')]
-        total_verifications = len(verifications)
-        successful_verifications = sum(1 for r in verifications if r['verification'].matches)
-        
-        return {
-            'total_images': total_images,
-            'successful_processing': successful,
-            'failed_processing': failed,
-            'success_rate': successful / total_images if total_images > 0 else 0,
-            'average_confidence': avg_confidence,
-            'average_processing_time': avg_processing_time,
-            'total_verifications': total_verifications,
-            'successful_verifications': successful_verifications,
-            'verification_success_rate': successful_verifications / total_verifications if total_verifications > 0 else 0
-        }
+        # Single pass over the results
+        summary = SummaryAccumulator()
+        for result in self.results:
+            summary.add(result)
+        return summary.to_dict()
 
 
 def main():
@@ -237,35 +549,54 @@ def main():
     parser.add_argument('--engine', choices=['tesseract', 'google_vision'], default='tesseract',
                        help='OCR engine to use')
     parser.add_argument('--output', help='Output file path')
-    parser.add_argument('--format', choices=['json', 'csv', 'excel'], default='json',
-                       help='Output format')
-    parser.add_argument('--workers', type=int, default=4, help='Number of worker threads')
+    parser.add_argument('--format', choices=['json', 'jsonl', 'csv', 'excel', 'parquet'], default='json',
+                       help='Output format (jsonl is always streamed)')
+    parser.add_argument('--stream', action='store_true',
+                       help='Write each result to disk as it completes instead of buffering the batch')
+    parser.add_argument('--workers', type=int, default=4, help='Number of worker processes/threads')
+    parser.add_argument('--tesseract-batch', type=int, default=1,
+                       help='Images per tesseract invocation (Tesseract engine only)')
     parser.add_argument('--tesseract-path', help='Path to Tesseract executable')
     parser.add_argument('--google-creds', help='Path to Google Cloud credentials')
     
     args = parser.parse_args()
     
+    # Fail before OCR'ing the directory, not when the results are written
+    if args.format == 'parquet':
+        try:
+            _require_pyarrow()
+        except ImportError as e:
+            raise SystemExit(str(e))
+    
     # Initialize OCR app
     ocr_app = OCRApp(args.tesseract_path, args.google_creds)
     
     # Initialize batch processor
-    processor = BatchProcessor(ocr_app, args.workers)
+    processor = BatchProcessor(ocr_app, args.workers, tesseract_batch_size=args.tesseract_batch)
     
-    # Process directory
     engine = OCREngine.TESSERACT if args.engine == 'tesseract' else OCREngine.GOOGLE_VISION
-    results = processor.process_directory(args.directory, engine)
     
-    # Save results
     if args.output:
-        processor.save_results(args.output, args.format)
+        output_path = args.output
     else:
         # Default output filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        default_output = f"ocr_batch_results_{timestamp}.{args.format}"
-        processor.save_results(default_output, args.format)
+        output_path = f"ocr_batch_results_{timestamp}.{args.format}"
+    
+    if args.stream or args.format == 'jsonl':
+        # Stream results to disk as they complete
+        if args.format == 'json':
+            raise SystemExit("--stream requires --format jsonl, csv, excel or parquet")
+        stats = processor.process_directory_stream(args.directory, output_path, args.format, engine)
+    else:
+        # Process directory
+        processor.process_directory(args.directory, engine)
+        
+        # Save results
+        processor.save_results(output_path, args.format)
+        stats = processor.get_summary_statistics()
     
     # Print summary
-    stats = processor.get_summary_statistics()
     print("\n=== BATCH PROCESSING SUMMARY ===")
     print(f"Total images: {stats.get('total_images', 0)}")
     print(f"Successful: {stats.get('successful_processing', 0)}")
@@ -1,8 +1,10 @@
+import bisect
+import functools
 import os
 import re
 import sys
 from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
-from typing import List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
 
 try:
     from PIL import Image
@@ -21,7 +23,22 @@ except ImportError:
 DEFAULT_TESSERACT_PATH = r"C:\\Program Files\\Tesseract-OCR\\tesseract.exe"
 TESSERACT_PATH = os.environ.get("TESSERACT_PATH", DEFAULT_TESSERACT_PATH)
 
-def configure_tesseract() -> None:
+# Patrones compilados una sola vez a nivel de módulo.
+_MONEY_RE = re.compile(r"(?:[\$€£¥])?\s*([+-]?\d{1,3}(?:[\.,]\d{3})*(?:[\.,]\d{2})|[+-]?\d+[\.,]\d{2})")
+_TOTAL_RE = re.compile(r"\b(total|importe\s*total|total\s*a\s*pagar|gran\s*total)\b", re.IGNORECASE)
+# Tabla para eliminar símbolos de moneda y espacios (los mismos que \s) con str.translate.
+_STRIP_TABLE = str.maketrans(
+    "", "", "$€£¥₡₱₲₵₴₹₽₺" + "".join(ch for ch in map(chr, range(0x3001)) if ch.isspace())
+)
+_TRAILING_COMMA_DEC = re.compile(r",\d{2}$")
+_TRAILING_DOT_DEC = re.compile(r"\.\d{2}$")
+
+@functools.lru_cache(maxsize=1)
+def configure_tesseract() -> bool:
+    """
+    Configura pytesseract una sola vez por proceso; las llamadas siguientes
+    devuelven el resultado cacheado sin volver a consultar el disco.
+    """
     if os.name == "nt":
         pytesseract.pytesseract.tesseract_cmd = TESSERACT_PATH
         if not os.path.isfile(pytesseract.pytesseract.tesseract_cmd):
@@ -30,6 +47,8 @@ def configure_tesseract() -> None:
                 "Instálalo y/o ajusta la variable TESSERACT_PATH.",
                 file=sys.stderr,
             )
+            return False
+    return True
 
 def load_image(image_path: str) -> Image.Image:
     if not os.path.isfile(image_path):
@@ -47,56 +66,149 @@ def ocr_extract_text(image: Image.Image) -> str:
         pass
     return pytesseract.image_to_string(image, lang="eng", config=config)
 
-def normalize_amount_str(raw: str) -> Optional[Decimal]:
+def _plain_to_cents(s: str) -> Optional[int]:
     """
-    Convierte cadenas numéricas (con . y ,) a Decimal(2).
+    Convierte una cadena "[+-]entero[.decimales]" a centavos enteros con
+    redondeo ROUND_HALF_UP. Devuelve None si no tiene esa forma simple.
+    """
+    negative = s[:1] == "-"
+    if s[:1] in "+-":
+        s = s[1:]
+    whole, _, frac = s.partition(".")
+    if not (whole or frac) or (whole and not whole.isdecimal()) or (frac and not frac.isdecimal()):
+        return None
+    cents = int(whole or "0") * 100 + int(frac[:2].ljust(2, "0"))
+    # int() y no una comparación de caracteres: \d también acepta dígitos no ASCII
+    if len(frac) > 2 and int(frac[2]) >= 5:
+        cents += 1
+    return -cents if negative else cents
+
+def _normalize_to_cents(raw: str) -> Optional[int]:
+    """
+    Convierte cadenas numéricas (con . y ,) a centavos enteros.
     Heurística:
     - Si hay ambos separadores (.,), el último es decimal.
     - Si solo hay coma y termina en ,dd → coma decimal.
     - Si solo hay punto y termina en .dd → punto decimal.
     - Separadores de miles se eliminan.
     """
-    s = raw.strip()
-    s = re.sub(r"[\s\$€£¥₡₱₲₵₴₹₽₺]", "", s)
+    s = raw.translate(_STRIP_TABLE)
     if not s:
         return None
 
     comma = "," in s
     dot = "." in s
 
-    try:
-        if comma and dot:
-            last_sep = max(s.rfind(","), s.rfind("."))
-            decimal_sep = s[last_sep]
-            thousand_sep = "," if decimal_sep == "." else "."
-            s_clean = s.replace(thousand_sep, "")
-            s_clean = s_clean.replace(decimal_sep, ".")
-            value = Decimal(s_clean)
-        elif comma and not dot:
-            if re.search(r",\d{2}$", s):
-                s_clean = s.replace(".", "")
-                s_clean = s_clean.replace(",", ".")
-                value = Decimal(s_clean)
-            else:
-                s_clean = s.replace(",", "")
-                value = Decimal(s_clean)
-        elif dot and not comma:
-            if re.search(r"\.\d{2}$", s):
-                parts = s.split(".")
-                if len(parts) > 2:
-                    s_clean = "".join(parts[:-1]) + "." + parts[-1]
-                else:
-                    s_clean = s
-                value = Decimal(s_clean)
+    if comma and dot:
+        last_sep = max(s.rfind(","), s.rfind("."))
+        decimal_sep = s[last_sep]
+        thousand_sep = "," if decimal_sep == "." else "."
+        s_clean = s.replace(thousand_sep, "")
+        s_clean = s_clean.replace(decimal_sep, ".")
+    elif comma and not dot:
+        if _TRAILING_COMMA_DEC.search(s):
+            s_clean = s.replace(",", ".")
+        else:
+            s_clean = s.replace(",", "")
+    elif dot and not comma:
+        if _TRAILING_DOT_DEC.search(s):
+            parts = s.split(".")
+            if len(parts) > 2:
+                s_clean = "".join(parts[:-1]) + "." + parts[-1]
             else:
-                s_clean = s.replace(".", "")
-                value = Decimal(s_clean)
+                s_clean = s
         else:
-            value = Decimal(s)
+            s_clean = s.replace(".", "")
+    else:
+        s_clean = s
+
+    cents = _plain_to_cents(s_clean)
+    if cents is not None:
+        return cents
 
-        return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    # Formas poco comunes (exponentes, etc.): se delega en Decimal.
+    try:
+        value = Decimal(s_clean).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
     except (InvalidOperation, ValueError):
         return None
+    if not value.is_finite():
+        return None
+    return int(value.scaleb(2))
+
+def _cents_to_decimal(cents: int) -> Decimal:
+    return Decimal(cents).scaleb(-2)
+
+def normalize_amount_str(raw: str) -> Optional[Decimal]:
+    """
+    Convierte cadenas numéricas (con . y ,) a Decimal(2).
+    Ver _normalize_to_cents para la heurística de separadores.
+    """
+    cents = _normalize_to_cents(raw)
+    if cents is None:
+        return None
+    return _cents_to_decimal(cents)
+
+def _has_cents_precision(v: Decimal) -> bool:
+    # Finito y con a lo sumo 2 decimales: pasar a centavos no pierde nada
+    exponent = v.as_tuple().exponent
+    return isinstance(exponent, int) and exponent >= -2
+
+def _decimal_to_cents(v: Decimal) -> int:
+    return int(v.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP).scaleb(2))
+
+def _extract_cents_from_text(text: str) -> Tuple[List[int], List[Tuple[int, int]], Optional[int]]:
+    """
+    Igual que extract_amounts_from_text, pero con los montos en centavos enteros.
+    """
+    # Offset de inicio de cada línea (según splitlines) y su índice entre las
+    # líneas no vacías (-1 para líneas en blanco).
+    line_starts: List[int] = []
+    line_indexes: List[int] = []
+    offset = 0
+    idx = 0
+    for raw_line in text.splitlines(keepends=True):
+        line_starts.append(offset)
+        if raw_line.strip():
+            line_indexes.append(idx)
+            idx += 1
+        else:
+            line_indexes.append(-1)
+        offset += len(raw_line)
+
+    def line_of(pos: int) -> int:
+        return line_indexes[bisect.bisect_right(line_starts, pos) - 1]
+
+    # Un solo recorrido de cada regex sobre el texto completo. Una palabra clave
+    # puede abarcar varias líneas ("gran\ntotal"); cuenta la línea donde termina.
+    total_lines = {line_of(m.end() - 1) for m in _TOTAL_RE.finditer(text)}
+
+    # Se trabaja en centavos enteros; la conversión a Decimal ocurre al final.
+    # En la misma pasada se obtienen los máximos y las líneas de cada monto.
+    cents_with_line_index: List[Tuple[int, int]] = []
+    lines_by_cents: Dict[int, Set[int]] = {}
+    max_total: Optional[int] = None
+    max_any: Optional[int] = None
+
+    for m in _MONEY_RE.finditer(text):
+        cents = _normalize_to_cents(m.group(1))
+        if cents is not None:
+            idx = line_of(m.start(1))
+            cents_with_line_index.append((idx, cents))
+            lines_by_cents.setdefault(cents, set()).add(idx)
+            if max_any is None or cents > max_any:
+                max_any = cents
+            if idx in total_lines and (max_total is None or cents > max_total):
+                max_total = cents
+
+    total_cents = max_total if max_total is not None else max_any
+
+    if total_cents is not None:
+        total_line_indexes = lines_by_cents[total_cents]
+        items_cents = [c for li, c in cents_with_line_index if li not in total_line_indexes]
+    else:
+        items_cents = [c for _, c in cents_with_line_index]
+
+    return items_cents, cents_with_line_index, total_cents
 
 def extract_amounts_from_text(text: str) -> Tuple[List[Decimal], List[Tuple[int, Decimal]], Optional[Decimal]]:
     """
@@ -105,52 +217,38 @@ def extract_amounts_from_text(text: str) -> Tuple[List[Decimal], List[Tuple[int,
     - amounts_with_line_index: (line_index, monto) para referencia
     - total_amount: total detectado (si existe)
     """
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-
-    money_regex = re.compile(r"(?:[\$€£¥])?\s*([+-]?\d{1,3}(?:[\.,]\d{3})*(?:[\.,]\d{2})|[+-]?\d+[\.,]\d{2})")
-    keywords_total = re.compile(r"\b(total|importe\s*total|total\s*a\s*pagar|gran\s*total)\b", re.IGNORECASE)
-
-    amounts_with_line_index: List[Tuple[int, Decimal]] = []
-    totals_found: List[Decimal] = []
-
-    for idx, line in enumerate(lines):
-        if keywords_total.search(line):
-            for m in money_regex.finditer(line):
-                val = normalize_amount_str(m.group(1))
-                if val is not None:
-                    totals_found.append(val)
-        for m in money_regex.finditer(line):
-            val = normalize_amount_str(m.group(1))
-            if val is not None:
-                amounts_with_line_index.append((idx, val))
-
-    total_amount: Optional[Decimal] = None
-    if totals_found:
-        total_amount = max(totals_found)
-    elif amounts_with_line_index:
-        total_amount = max(val for _, val in amounts_with_line_index)
-
-    amounts_all: List[Decimal] = []
-    if total_amount is not None:
-        total_line_indexes = {li for li, v in amounts_with_line_index if v == total_amount}
-        for li, v in amounts_with_line_index:
-            if li in total_line_indexes:
-                continue
-            if (v * 100) % 1 == 0:
-                amounts_all.append(v)
-    else:
-        for _, v in amounts_with_line_index:
-            if (v * 100) % 1 == 0:
-                amounts_all.append(v)
-
+    items_cents, cents_with_line_index, total_cents = _extract_cents_from_text(text)
+    amounts_all = [_cents_to_decimal(c) for c in items_cents]
+    amounts_with_line_index = [(li, _cents_to_decimal(c)) for li, c in cents_with_line_index]
+    total_amount = _cents_to_decimal(total_cents) if total_cents is not None else None
     return amounts_all, amounts_with_line_index, total_amount
 
-def sum_and_compare(items: List[Decimal], total: Optional[Decimal], tolerance: Decimal = Decimal("0.02")) -> Tuple[Decimal, bool]:
-    sum_items = sum(items, start=Decimal("0.00")).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+def _sum_and_compare_cents(items: List[int], total: Optional[int], tolerance: int = 2) -> Tuple[int, bool]:
+    sum_items = sum(items)
     if total is None:
         return sum_items, False
     return sum_items, (abs(sum_items - total) <= tolerance)
 
+def sum_and_compare(items: List[Decimal], total: Optional[Decimal], tolerance: Decimal = Decimal("0.02")) -> Tuple[Decimal, bool]:
+    """
+    Suma los ítems y compara con el total; la suma se redondea a centavos una sola vez.
+    Si todos los montos (y la tolerancia) tienen a lo sumo 2 decimales, la aritmética
+    se hace en centavos enteros con el mismo resultado; si no, se suma en Decimal.
+    """
+    values = [*items, tolerance] if total is None else [*items, total, tolerance]
+    if not all(_has_cents_precision(v) for v in values):
+        sum_items = sum(items, start=Decimal("0.00")).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        if total is None:
+            return sum_items, False
+        return sum_items, (abs(sum_items - total) <= tolerance)
+
+    sum_cents, matches = _sum_and_compare_cents(
+        [_decimal_to_cents(v) for v in items],
+        _decimal_to_cents(total) if total is not None else None,
+        _decimal_to_cents(tolerance),
+    )
+    return _cents_to_decimal(sum_cents), matches
+
 def main() -> None:
     configure_tesseract()
     image_path = os.path.join(os.getcwd(), "factura.jpg")
@@ -165,7 +263,9 @@ def main() -> None:
     print("\n=== TEXTO OCR EXTRAÍDO ===\n")
     print(text)
 
-    items, _items_with_idx, total = extract_amounts_from_text(text)
+    items_cents, _items_with_idx, total_cents = _extract_cents_from_text(text)
+    items = [_cents_to_decimal(c) for c in items_cents]
+    total = _cents_to_decimal(total_cents) if total_cents is not None else None
 
     print("\n=== DETECCIÓN DE MONTOS ===")
     if total is not None:
@@ -180,8 +280,8 @@ def main() -> None:
     else:
         print("No se detectaron ítems con formato monetario claro (xx,dd o xx.dd).")
 
-    sum_items, matches = sum_and_compare(items, total)
-    print(f"\nSuma de ítems: {sum_items}")
+    sum_cents, matches = _sum_and_compare_cents(items_cents, total_cents)
+    print(f"\nSuma de ítems: {_cents_to_decimal(sum_cents)}")
     if total is not None:
         print(f"Total indicado: {total}")
         print("\nResultado:")
@@ -2,12 +2,27 @@
 OCR Engine Module - Supports both Tesseract and Google Cloud Vision
 """
 import os
+import io
 import re
+import shlex
+import functools
+import hashlib
 import json
-from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
-from typing import List, Tuple, Optional, Dict, Any
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict, defaultdict
+from decimal import Decimal
+from typing import List, Tuple, Optional, Dict, Any, Union
 from dataclasses import dataclass
 from enum import Enum
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Tesseract's OpenMP threading scales poorly; run one thread per process and parallelize
+# across images instead. Set before tesseract/libtesseract is loaded or spawned.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+import numpy as np
 
 try:
     from PIL import Image
@@ -23,6 +38,177 @@ except ImportError:
     GOOGLE_VISION_AVAILABLE = False
     print("Google Cloud Vision not available. Install with: pip install google-cloud-vision")
 
+# Optional linear-time regex engine for the text-processing hot path (pip install google-re2)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+
+# Optional in-process Tesseract API (pip install tesserocr); avoids a tesseract process per image
+try:
+    from tesserocr import PyTessBaseAPI, PSM
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+
+# Optional faster content hashing (pip install blake3) and on-disk result cache (pip install diskcache)
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# Images per Vision batch_annotate_images request (API limit for synchronous calls)
+VISION_BATCH_SIZE = 16
+
+# Largest |sum of items - total| still accepted as a match, in cents
+TOLERANCE_CENTS = 2
+
+# Longest image edge fed to OCR (about 300 DPI for a letter-size page); larger inputs are downscaled
+MAX_OCR_DIMENSION = 2400
+
+# Grayscale modes wider than 8 bits; Image.convert("L") would clip them instead of scaling
+_HIGH_BIT_DEPTH_MODES = ('I;16', 'I;16L', 'I;16B', 'I;16N', 'I', 'F')
+
+
+def _to_8bit_gray(image: Image.Image) -> Image.Image:
+    """Scale a 16/32-bit or float grayscale image into an 8-bit L image"""
+    pixels = np.asarray(image)
+    if image.mode.startswith('I;16'):
+        pixels = pixels >> 8
+    else:
+        # 32-bit integer and float images carry no fixed range: unit floats are stretched,
+        # 8-bit data is kept, 16-bit data is scaled as such, anything wider by its peak
+        peak = float(pixels.max()) if pixels.size else 0.0
+        if image.mode == 'F' and peak <= 1.0:
+            pixels = pixels * 255.0
+        elif peak > 65535:
+            pixels = pixels * (255.0 / peak)
+        elif peak > 255:
+            pixels = pixels / 257.0
+    return Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8))
+
+# Tesseract options shared by the single-image and batch paths
+TESSERACT_WHITELIST = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz.,-$€£¥₡₱₲₵₴₹₽₺"
+TESSERACT_CONFIG = f"--psm 6 -c tessedit_char_whitelist={TESSERACT_WHITELIST} "
+
+
+@functools.lru_cache(maxsize=None)
+def _tesseract_exists(tesseract_path: str) -> bool:
+    """Whether the Tesseract executable exists; memoized so repeated managers skip the stat"""
+    return os.path.exists(tesseract_path)
+
+
+def configure_tesseract(tesseract_path: str) -> bool:
+    """Point pytesseract at the Tesseract executable (Windows only).
+
+    Returns True when tesseract_cmd was updated. Only the existence check is
+    memoized: the assignment always runs, so the latest manager's path wins.
+    """
+    if os.name == "nt" and _tesseract_exists(tesseract_path):
+        pytesseract.pytesseract.tesseract_cmd = tesseract_path
+        return True
+    return False
+
+
+# Every character str.isspace() accepts: the stdlib re \s set (none lie above U+3000)
+_UNICODE_SPACES = ''.join(ch for ch in map(chr, range(0x3001)) if ch.isspace())
+
+# Currency symbols plus whitespace
+_STRIP_TABLE = str.maketrans('', '', '$€£¥₡₱₲₵₴₹₽₺' + _UNICODE_SPACES)
+
+# RE2's \d, \s and \b are ASCII-only; these spell out the Unicode meaning stdlib re gives
+# them. RE2 has no lookaround, so \b consumes the neighbouring non-word character: the
+# match still happens at the same places, but its span can include that character.
+_RE2_UNICODE_ESCAPES = {
+    'd': r'\p{Nd}',
+    's': '[' + ''.join(f'\\x{{{ord(ch):x}}}' for ch in _UNICODE_SPACES) + ']',
+    'b': r'(?:^|$|[^\p{L}\p{N}_])',
+}
+
+
+def _re2_pattern(pattern: str) -> str:
+    """Rewrite a stdlib re pattern's \\d, \\s and \\b for RE2 (\\s must not sit inside [...])"""
+    return re.sub(r'\\(.)', lambda m: _RE2_UNICODE_ESCAPES.get(m.group(1), m.group(0)), pattern)
+
+
+# Largest cents magnitude a 2-decimal Decimal can hold in the default 28-digit context
+_MAX_CENTS_DIGITS = 28
+_MAX_CENTS = 10 ** _MAX_CENTS_DIGITS
+
+
+def _ends_with_cents(s: str, sep: str) -> bool:
+    """True if s ends with `sep` followed by exactly two digits"""
+    return len(s) >= 3 and s[-3] == sep and s[-2:].isdecimal()
+
+
+def _plain_to_cents(s: str) -> Optional[int]:
+    """Parse "[+-]digits[.digits]" into integer cents (ROUND_HALF_UP), or None for other forms"""
+    negative = s[:1] == '-'
+    if s[:1] in ('+', '-'):
+        s = s[1:]
+    integer_part, _, decimal_part = s.partition('.')
+    if not (integer_part or decimal_part):
+        return None
+    if (integer_part and not integer_part.isdecimal()) or (decimal_part and not decimal_part.isdecimal()):
+        return None
+    cents = int(integer_part or '0') * 100 + int(decimal_part[:2].ljust(2, '0'))
+    if len(decimal_part) > 2 and int(decimal_part[2]) >= 5:
+        cents += 1
+    return -cents if negative else cents
+
+
+def _scientific_to_cents(s: str) -> Optional[int]:
+    """Parse "[+-]digits[.digits]e[+-]digits" into integer cents (ROUND_HALF_UP), or None"""
+    mantissa, sep, exponent = s.replace('E', 'e').partition('e')
+    negative = mantissa[:1] == '-'
+    if mantissa[:1] in ('+', '-'):
+        mantissa = mantissa[1:]
+    integer_part, _, decimal_part = mantissa.partition('.')
+    digits = integer_part + decimal_part
+    exp_digits = exponent[1:] if exponent[:1] in ('+', '-') else exponent
+    if not sep or not digits.isdecimal() or not exp_digits.isdecimal():
+        return None
+    
+    coefficient = int(digits)
+    # Power of ten that turns the coefficient into cents
+    shift = int(exponent) - len(decimal_part) + 2
+    if coefficient == 0:
+        cents = 0
+    elif shift >= 0:
+        if len(str(coefficient)) + shift > _MAX_CENTS_DIGITS:
+            return None
+        cents = coefficient * 10 ** shift
+    elif -shift > len(digits):
+        # Below a tenth of a cent: rounds to zero
+        cents = 0
+    else:
+        cents, remainder = divmod(coefficient, 10 ** -shift)
+        if 2 * remainder >= 10 ** -shift:
+            cents += 1
+    return -cents if negative else cents
+
+
+def _cents_to_decimal(cents: int) -> Decimal:
+    """Integer cents to a 2-decimal Decimal"""
+    return Decimal(cents).scaleb(-2)
+
+
+def _cents_array(cents: List[int]) -> np.ndarray:
+    """Pack cents into int64, or keep Python ints when their sum could overflow int64"""
+    if cents and max(cents) * len(cents) > np.iinfo(np.int64).max:
+        return np.array(cents, dtype=object)
+    return np.array(cents, dtype=np.int64)
+
 
 class OCREngine(Enum):
     TESSERACT = "tesseract"
@@ -53,7 +239,7 @@ class VerificationResult:
     calculated_sum: Decimal
     matches: bool
     difference: Decimal
-    tolerance: Decimal = Decimal("0.02")
+    tolerance: Decimal = _cents_to_decimal(TOLERANCE_CENTS)
 
 
 class OCREngineManager:
@@ -62,12 +248,86 @@ class OCREngineManager:
         self.google_credentials_path = google_credentials_path
         
         # Configure Tesseract
-        if os.name == "nt" and os.path.exists(self.tesseract_path):
-            pytesseract.pytesseract.tesseract_cmd = self.tesseract_path
+        configure_tesseract(self.tesseract_path)
+        
+        # Long-lived tesserocr API (created on first use); the model stays loaded between images
+        self._tess_api = None
+        self._tess_api_language = None
+        self._tess_api_lock = threading.Lock()
         
         # Configure Google Vision
         if GOOGLE_VISION_AVAILABLE and self.google_credentials_path:
             os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = self.google_credentials_path
+        
+        # Vision client (gRPC channel + credentials) is created on first use and then reused
+        self._vision_client = None
+        self._vision_client_lock = threading.Lock()
+
+    def __del__(self):
+        # Release the tesserocr API (and its loaded model)
+        api = getattr(self, '_tess_api', None)
+        if api is not None:
+            api.End()
+
+    def _get_tesseract_api(self, language: str) -> "PyTessBaseAPI":
+        """Return the shared tesserocr API, (re)initialized for `language`; caller holds the lock"""
+        if self._tess_api is None or self._tess_api_language != language:
+            if self._tess_api is not None:
+                self._tess_api.End()
+            self._tess_api = PyTessBaseAPI(lang=language, psm=PSM.SINGLE_BLOCK)
+            self._tess_api.SetVariable("tessedit_char_whitelist", TESSERACT_WHITELIST)
+            self._tess_api_language = language
+        return self._tess_api
+
+    def _run_tesserocr(self, image: Image.Image, language: str) -> Tuple[str, Dict[str, Any]]:
+        """OCR with the in-process tesserocr API; returns text and per-word data like image_to_data"""
+        # Hand tesseract the raw pixel buffer: SetImage would first re-encode the image in memory.
+        # Images arrive 8-bit from _prepare_for_ocr (L), so the buffer is 1 byte per band.
+        bytes_per_pixel = len(image.getbands())
+        width, height = image.size
+        pixels = image.tobytes()
+        
+        with self._tess_api_lock:
+            api = self._get_tesseract_api(language)
+            api.SetImageBytes(pixels, width, height, bytes_per_pixel, width * bytes_per_pixel)
+            text = api.GetUTF8Text()
+            words = api.MapWordConfidences()
+        return text, {'text': [word for word, _ in words], 'conf': [conf for _, conf in words]}
+
+    @staticmethod
+    def _prepare_for_ocr(image: Image.Image, max_dim: int = MAX_OCR_DIMENSION) -> Image.Image:
+        """Convert to grayscale and shrink so the longest edge is at most max_dim pixels"""
+        # Flatten transparency onto white first: convert("L") drops alpha, so dark text
+        # on a transparent background would otherwise become a solid black page
+        if 'A' in image.getbands() or 'transparency' in image.info:
+            rgba = image.convert('RGBA')
+            image = Image.new('RGB', rgba.size, (255, 255, 255))
+            image.paste(rgba, mask=rgba.getchannel('A'))
+        if image.mode in _HIGH_BIT_DEPTH_MODES:
+            image = _to_8bit_gray(image)
+        elif image.mode != "L":
+            image = image.convert("L")
+        w, h = image.size
+        m = max(w, h)
+        if m > max_dim:
+            image = image.resize((max(1, int(w * max_dim / m)), max(1, int(h * max_dim / m))), Image.LANCZOS)
+        return image
+
+    def _run_pytesseract(self, image: Image.Image, language: str) -> Tuple[str, Dict[str, Any]]:
+        """OCR through the tesseract executable; returns text and image_to_data output"""
+        # Encode once with fast PNG settings and point both calls at the same file
+        # (given a PIL image, pytesseract re-encodes it at the default level on every call)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = os.path.join(tmp_dir, 'input.png')
+            image.save(input_path, format='PNG', compress_level=1, optimize=False)
+            
+            # Try with Spanish + English
+            config = TESSERACT_CONFIG
+            text = pytesseract.image_to_string(input_path, lang=language, config=config)
+            
+            # Get confidence data
+            data = pytesseract.image_to_data(input_path, lang=language, config=config, output_type=pytesseract.Output.DICT)
+        return text, data
 
     def extract_text_tesseract(self, image: Image.Image, language: str = "spa+eng") -> OCRResult:
         """Extract text using Tesseract OCR"""
@@ -75,14 +335,16 @@ class OCREngineManager:
         start_time = time.time()
         
         try:
-            # Try with Spanish + English
-            config = "--psm 6 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz.,-$€£¥₡₱₲₵₴₹₽₺ "
-            text = pytesseract.image_to_string(image, lang=language, config=config)
+            image = self._prepare_for_ocr(image)
             
-            # Get confidence data
-            data = pytesseract.image_to_data(image, lang=language, config=config, output_type=pytesseract.Output.DICT)
-            confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+            if TESSEROCR_AVAILABLE:
+                text, data = self._run_tesserocr(image, language)
+            else:
+                text, data = self._run_pytesseract(image, language)
+            # One conversion pass (truncating like int()), then mean of the positive scores
+            confidences = np.asarray(data['conf'], dtype=np.int16)
+            confidences = confidences[confidences > 0]
+            avg_confidence = float(confidences.mean()) if confidences.size else 0
             
             processing_time = time.time() - start_time
             
@@ -102,46 +364,147 @@ class OCREngineManager:
                 processing_time=processing_time
             )
 
-    def extract_text_google_vision(self, image: Image.Image) -> OCRResult:
-        """Extract text using Google Cloud Vision API"""
-        if not GOOGLE_VISION_AVAILABLE:
-            raise ImportError("Google Cloud Vision not available")
+    def extract_text_tesseract_batch(self, image_paths: List[str], language: str = "spa+eng") -> List[OCRResult]:
+        """Extract text from several images with a single Tesseract run over an image list file.
+
+        The language data is loaded once for the whole list. Each image gets the same
+        preparation as extract_text_tesseract (and goes through tesserocr when installed),
+        so results match the single-image path. Raises ValueError if the output pages do
+        not line up one-to-one with the inputs, and OSError/CalledProcessError if an image
+        cannot be read or tesseract cannot run.
+        """
+        if TESSEROCR_AVAILABLE:
+            # The long-lived API already keeps the model loaded between images
+            results = []
+            for image_path in image_paths:
+                with Image.open(image_path) as image:
+                    results.append(self.extract_text_tesseract(image, language))
+            return results
         
         import time
         start_time = time.time()
         
-        try:
-            client = vision.ImageAnnotatorClient()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # The list points at prepared copies (grayscale, downscaled), not the originals
+            prepared_paths = []
+            for n, image_path in enumerate(image_paths):
+                prepared_path = os.path.join(tmp_dir, f'page{n}.png')
+                with Image.open(image_path) as image:
+                    self._prepare_for_ocr(image).save(prepared_path, format='PNG', compress_level=1, optimize=False)
+                prepared_paths.append(prepared_path)
             
-            # Convert PIL image to bytes
-            import io
-            img_byte_arr = io.BytesIO()
-            image.save(img_byte_arr, format='PNG')
-            img_byte_arr = img_byte_arr.getvalue()
+            list_path = os.path.join(tmp_dir, 'imagelist.txt')
+            with open(list_path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(prepared_paths) + '\n')
             
-            vision_image = vision.Image(content=img_byte_arr)
-            response = client.text_detection(image=vision_image)
-            
-            if response.error.message:
-                raise Exception(f"Google Vision API error: {response.error.message}")
-            
-            texts = response.text_annotations
-            if texts:
-                full_text = texts[0].description
-                confidence = 1.0  # Google Vision doesn't provide confidence for full text
-            else:
-                full_text = ""
-                confidence = 0.0
-            
-            processing_time = time.time() - start_time
+            # One invocation writes both the text and the word-level TSV (for confidences)
+            output_base = os.path.join(tmp_dir, 'out')
+            subprocess.run(
+                [pytesseract.pytesseract.tesseract_cmd, list_path, output_base, '-l', language,
+                 *shlex.split(TESSERACT_CONFIG), 'txt', 'tsv'],
+                check=True, capture_output=True
+            )
             
-            return OCRResult(
-                text=full_text,
-                confidence=confidence,
-                engine=OCREngine.GOOGLE_VISION,
-                processing_time=processing_time,
-                raw_data={"annotations": [{"description": t.description, "bounding_poly": t.bounding_poly} for t in texts]}
+            with open(output_base + '.txt', encoding='utf-8') as f:
+                pages = f.read().split('\f')
+            with open(output_base + '.tsv', encoding='utf-8') as f:
+                tsv_rows = [line.split('\t') for line in f.read().splitlines()[1:]]
+        
+        # Tesseract separates pages with a form feed; drop a trailing empty chunk
+        if len(pages) == len(image_paths) + 1 and not pages[-1].strip():
+            pages.pop()
+        if len(pages) != len(image_paths):
+            raise ValueError(f"Tesseract returned {len(pages)} pages for {len(image_paths)} images")
+        
+        # Average word confidence per page (TSV column 1 is page_num, 10 is conf)
+        page_confidences: Dict[str, List[int]] = {}
+        for row in tsv_rows:
+            if len(row) < 11:
+                continue
+            confs = page_confidences.setdefault(row[1], [])
+            conf = int(float(row[10]))
+            if conf > 0:
+                confs.append(conf)
+        if len(page_confidences) != len(image_paths):
+            raise ValueError(f"Tesseract returned data for {len(page_confidences)} pages, expected {len(image_paths)}")
+        
+        # Startup cost is shared, so spread the wall time evenly across the images
+        processing_time = (time.time() - start_time) / len(image_paths)
+        ordered = [page_confidences[page] for page in sorted(page_confidences, key=int)]
+        
+        return [
+            OCRResult(
+                text=text.strip(),
+                confidence=(sum(confs) / len(confs) if confs else 0) / 100.0,
+                engine=OCREngine.TESSERACT,
+                processing_time=processing_time
             )
+            for text, confs in zip(pages, ordered)
+        ]
+
+    def _get_vision_client(self) -> "vision.ImageAnnotatorClient":
+        """Return the shared Vision client, creating it on first use"""
+        if self._vision_client is None:
+            with self._vision_client_lock:
+                if self._vision_client is None:
+                    self._vision_client = vision.ImageAnnotatorClient()
+        return self._vision_client
+
+    @staticmethod
+    def _encode_for_vision(image: Image.Image) -> bytes:
+        """Convert PIL image to bytes (JPEG q90: far cheaper than PNG and equivalent for Vision OCR)"""
+        if image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        img_byte_arr = io.BytesIO()
+        image.save(img_byte_arr, format='JPEG', quality=90, optimize=False)
+        return img_byte_arr.getvalue()
+
+    def _vision_content(self, image: Optional[Image.Image], image_bytes: Optional[bytes]) -> bytes:
+        """Bytes to upload: the original file unless the image first has to be downscaled"""
+        if image_bytes is not None and (image is None or max(image.size) <= MAX_OCR_DIMENSION):
+            return image_bytes
+        return self._encode_for_vision(self._prepare_for_ocr(image))
+
+    @staticmethod
+    def _vision_response_to_result(response, processing_time: float) -> OCRResult:
+        """Build an OCRResult from a Vision text-detection response"""
+        if response.error.message:
+            raise Exception(f"Google Vision API error: {response.error.message}")
+        
+        texts = response.text_annotations
+        if texts:
+            full_text = texts[0].description
+            confidence = 1.0  # Google Vision doesn't provide confidence for full text
+        else:
+            full_text = ""
+            confidence = 0.0
+        
+        return OCRResult(
+            text=full_text,
+            confidence=confidence,
+            engine=OCREngine.GOOGLE_VISION,
+            processing_time=processing_time,
+            raw_data={"annotations": [{"description": t.description, "bounding_poly": t.bounding_poly} for t in texts]}
+        )
+
+    def extract_text_google_vision(self, image: Optional[Image.Image] = None,
+                                   image_bytes: Optional[bytes] = None) -> OCRResult:
+        """Extract text using Google Cloud Vision API
+
+        image_bytes (the encoded file as read from disk) is sent as-is when given, unless the
+        image exceeds MAX_OCR_DIMENSION; otherwise the prepared `image` is encoded for upload.
+        """
+        if not GOOGLE_VISION_AVAILABLE:
+            raise ImportError("Google Cloud Vision not available")
+        
+        import time
+        start_time = time.time()
+        
+        try:
+            client = self._get_vision_client()
+            vision_image = vision.Image(content=self._vision_content(image, image_bytes))
+            response = client.text_detection(image=vision_image)
+            return self._vision_response_to_result(response, time.time() - start_time)
         except Exception as e:
             processing_time = time.time() - start_time
             return OCRResult(
@@ -151,12 +514,54 @@ class OCREngineManager:
                 processing_time=processing_time
             )
 
-    def extract_text(self, image: Image.Image, engine: OCREngine = OCREngine.TESSERACT) -> OCRResult:
-        """Extract text using specified OCR engine"""
+    def extract_text_google_vision_batch(self, images: List[Image.Image],
+                                         image_bytes: Optional[List[bytes]] = None) -> List[OCRResult]:
+        """Extract text from several images with one batch_annotate_images request per 16 images
+
+        image_bytes, when given, holds the encoded file of each image (used as in
+        extract_text_google_vision).
+        """
+        if not GOOGLE_VISION_AVAILABLE:
+            raise ImportError("Google Cloud Vision not available")
+        
+        import time
+        client = self._get_vision_client()
+        feature = vision.Feature(type_=vision.Feature.Type.TEXT_DETECTION)
+        results = []
+        
+        for start in range(0, len(images), VISION_BATCH_SIZE):
+            chunk = images[start:start + VISION_BATCH_SIZE]
+            start_time = time.time()
+            chunk_bytes = image_bytes[start:start + VISION_BATCH_SIZE] if image_bytes is not None else [None] * len(chunk)
+            contents = [self._vision_content(image, data) for image, data in zip(chunk, chunk_bytes)]
+            requests = [
+                vision.AnnotateImageRequest(image=vision.Image(content=content), features=[feature])
+                for content in contents
+            ]
+            responses = client.batch_annotate_images(requests=requests).responses
+            # One round trip for the chunk, so spread its wall time evenly
+            processing_time = (time.time() - start_time) / len(chunk)
+            
+            for response in responses:
+                try:
+                    results.append(self._vision_response_to_result(response, processing_time))
+                except Exception:
+                    results.append(OCRResult(
+                        text="",
+                        confidence=0.0,
+                        engine=OCREngine.GOOGLE_VISION,
+                        processing_time=processing_time
+                    ))
+        
+        return results
+
+    def extract_text(self, image: Image.Image, engine: OCREngine = OCREngine.TESSERACT,
+                     image_bytes: Optional[bytes] = None) -> OCRResult:
+        """Extract text using specified OCR engine (image_bytes: the encoded source, if at hand)"""
         if engine == OCREngine.TESSERACT:
             return self.extract_text_tesseract(image)
         elif engine == OCREngine.GOOGLE_VISION:
-            return self.extract_text_google_vision(image)
+            return self.extract_text_google_vision(image, image_bytes=image_bytes)
         else:
             raise ValueError(f"Unsupported OCR engine: {engine}")
 
@@ -167,10 +572,8 @@ class TextProcessor:
     def __init__(self):
         # Enhanced regex patterns for different number formats
         self.money_patterns = [
-            # Standard formats: 123.45, 1,234.56, 123,45
+            # Standard formats: 123.45, 1,234.56, 123,45 (the currency symbol is optional)
             r'(?:[\$€£¥₡₱₲₵₴₹₽₺]?\s*)?([+-]?\d{1,3}(?:[\.,]\d{3})*(?:[\.,]\d{2})|[+-]?\d+[\.,]\d{2})',
-            # Without currency symbol
-            r'([+-]?\d{1,3}(?:[\.,]\d{3})*(?:[\.,]\d{2})|[+-]?\d+[\.,]\d{2})',
             # Scientific notation
             r'([+-]?\d+\.?\d*[eE][+-]?\d+)',
         ]
@@ -183,99 +586,187 @@ class TextProcessor:
             r'\b(descuento|discount)\b',
             r'\b(propina|tip)\b'
         ]
+        
+        # Compiled once: one alternation per pattern family so each line is scanned a single time.
+        # RE2 (when installed) runs these as a linear-time automaton with no backtracking, with
+        # \d, \s and \b rewritten to stdlib re's Unicode classes so both backends find the same amounts
+        # (total_re is only used to test for a keyword, so its wider RE2 spans do not matter).
+        money_re = "(?i)" + "|".join(f"(?:{p})" for p in self.money_patterns)
+        total_re = "(?i)" + "|".join(f"(?:{p})" for p in self.total_keywords)
+        if RE2_AVAILABLE:
+            self.money_re = re2.compile(_re2_pattern(money_re))
+            self.total_re = re2.compile(_re2_pattern(total_re))
+        else:
+            self.money_re = re.compile(money_re)
+            self.total_re = re.compile(total_re)
 
-    def normalize_amount(self, raw_amount: str) -> Optional[Decimal]:
-        """Normalize various number formats to Decimal"""
+    def _amount_to_cents(self, raw_amount: str) -> Optional[int]:
+        """Normalize various number formats to integer cents (ROUND_HALF_UP)"""
         if not raw_amount:
             return None
             
         # Clean the string
-        s = raw_amount.strip()
-        s = re.sub(r'[\s\$€£¥₡₱₲₵₴₹₽₺]', '', s)
+        s = raw_amount.translate(_STRIP_TABLE)
         
         if not s:
             return None
 
-        try:
-            # Handle different decimal separators
-            comma_count = s.count(',')
-            dot_count = s.count('.')
+        # Handle different decimal separators (C-level str methods only, no regex)
+        comma_count = s.count(',')
+        dot_count = s.count('.')
+        
+        if comma_count > 0 and dot_count > 0:
+            # Both separators present - last one is decimal
+            last_comma = s.rfind(',')
+            last_dot = s.rfind('.')
             
-            if comma_count > 0 and dot_count > 0:
-                # Both separators present - last one is decimal
-                last_comma = s.rfind(',')
-                last_dot = s.rfind('.')
-                decimal_pos = max(last_comma, last_dot)
-                
-                if decimal_pos == last_dot:
-                    # Dot is decimal separator
-                    integer_part = s[:last_dot].replace(',', '')
-                    decimal_part = s[last_dot+1:]
-                else:
-                    # Comma is decimal separator
-                    integer_part = s[:last_comma].replace('.', '')
-                    decimal_part = s[last_comma+1:]
-                
-                s_clean = integer_part + '.' + decimal_part
-                
-            elif comma_count > 0:
-                # Only commas - check if it's decimal (ends with ,XX)
-                if re.search(r',\d{2}$', s):
-                    s_clean = s.replace(',', '.')
-                else:
-                    s_clean = s.replace(',', '')
-                    
-            elif dot_count > 0:
-                # Only dots - check if it's decimal (ends with .XX)
-                if re.search(r'\.\d{2}$', s):
-                    s_clean = s
-                else:
-                    s_clean = s.replace('.', '')
+            if last_dot > last_comma:
+                # Dot is decimal separator
+                integer_part = s[:last_dot].replace(',', '')
+                decimal_part = s[last_dot+1:]
             else:
-                s_clean = s
+                # Comma is decimal separator
+                integer_part = s[:last_comma].replace('.', '')
+                decimal_part = s[last_comma+1:]
             
-            # Convert to Decimal and round to 2 decimal places
-            value = Decimal(s_clean)
-            return value.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+            s_clean = integer_part + '.' + decimal_part
             
-        except (InvalidOperation, ValueError):
+        elif comma_count > 0:
+            # Only commas - check if it's decimal (ends with ,XX)
+            if _ends_with_cents(s, ','):
+                s_clean = s.replace(',', '.')
+            else:
+                s_clean = s.replace(',', '')
+                
+        elif dot_count > 0:
+            # Only dots - check if it's decimal (ends with .XX)
+            if _ends_with_cents(s, '.'):
+                s_clean = s
+            else:
+                s_clean = s.replace('.', '')
+        else:
+            s_clean = s
+        
+        # Integer arithmetic only; anything else (stray separators) is not a number
+        cents = _plain_to_cents(s_clean)
+        if cents is None:
+            cents = _scientific_to_cents(s_clean)
+        if cents is None:
             return None
+        # Amounts are limited to the 28 significant digits of the default Decimal context
+        return cents if abs(cents) < _MAX_CENTS else None
+
+    def normalize_amount(self, raw_amount: str) -> Optional[Decimal]:
+        """Normalize various number formats to Decimal"""
+        cents = self._amount_to_cents(raw_amount)
+        if cents is None:
+            return None
+        return _cents_to_decimal(cents)
+
+    def _index_lines(self, text: str) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Split text into stripped non-empty lines, plus the data to map a text offset to one.
+        
+        Returns (lines, line_starts, line_indexes): line_starts holds the offset of every
+        splitlines() line and line_indexes its position in `lines` (-1 for blank lines).
+        Computed once per text and shared by the amount scan and the total lookup.
+        """
+        lines = []
+        line_starts = []
+        line_indexes = []
+        offset = 0
+        for raw_line in text.splitlines(keepends=True):
+            line_starts.append(offset)
+            stripped = raw_line.strip()
+            if stripped:
+                line_indexes.append(len(lines))
+                lines.append(stripped)
+            else:
+                line_indexes.append(-1)
+            offset += len(raw_line)
+        return lines, np.array(line_starts, dtype=np.int64), np.array(line_indexes, dtype=np.int32)
 
-    def extract_amounts(self, text: str) -> List[AmountInfo]:
+    def extract_amount_arrays(self, text: str,
+                              line_index: Optional[Tuple[List[str], np.ndarray, np.ndarray]] = None
+                              ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """Extract all monetary amounts as parallel arrays.
+        
+        Returns (values, line_numbers, contexts): positive amounts in cents (int64),
+        their line indexes (int32) and the matching line text, in document order.
+        line_index is a precomputed _index_lines(text).
+        """
+        lines, line_starts, line_indexes = line_index if line_index is not None else self._index_lines(text)
+        values = []
+        starts = []
+        
+        # Single scan over the whole text; offsets are mapped back to lines afterwards
+        for match in self.money_re.finditer(text):
+            # Each alternative has one capture group; lastindex is the one that matched
+            group = match.lastindex
+            cents = self._amount_to_cents(match.group(group))
+            
+            if cents is not None and cents > 0:  # Only positive amounts
+                values.append(cents)
+                starts.append(match.start(group))
+        
+        # One vectorized binary search for all match offsets
+        line_pos = np.searchsorted(line_starts, np.array(starts, dtype=np.int64), side='right') - 1
+        line_numbers = line_indexes[line_pos]
+        contexts = [lines[line_idx] for line_idx in line_numbers.tolist()]
+        return _cents_array(values), line_numbers, contexts
+
+    def _amount_info(self, values: np.ndarray, line_numbers: np.ndarray,
+                     contexts: List[str], idx: int) -> AmountInfo:
+        """Materialize one entry of the amount arrays"""
+        return AmountInfo(
+            value=_cents_to_decimal(int(values[idx])),
+            line_number=int(line_numbers[idx]),
+            context=contexts[idx],
+            confidence=1.0
+        )
+
+    def extract_amounts(self, text: str,
+                        line_index: Optional[Tuple[List[str], np.ndarray, np.ndarray]] = None) -> List[AmountInfo]:
         """Extract all monetary amounts from text"""
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        amounts = []
-        
-        for line_idx, line in enumerate(lines):
-            for pattern in self.money_patterns:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
-                for match in matches:
-                    amount_str = match.group(1)
-                    normalized = self.normalize_amount(amount_str)
-                    
-                    if normalized and normalized > 0:  # Only positive amounts
-                        amounts.append(AmountInfo(
-                            value=normalized,
-                            line_number=line_idx,
-                            context=line,
-                            confidence=1.0
-                        ))
-        
-        return amounts
-
-    def identify_total(self, amounts: List[AmountInfo], text: str) -> Optional[AmountInfo]:
-        """Identify the total amount from the list of amounts"""
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        
-        # Look for amounts in lines with total keywords
-        total_candidates = []
-        
-        for line_idx, line in enumerate(lines):
-            for keyword_pattern in self.total_keywords:
-                if re.search(keyword_pattern, line, re.IGNORECASE):
-                    # Find amounts in this line
-                    line_amounts = [amt for amt in amounts if amt.line_number == line_idx]
-                    total_candidates.extend(line_amounts)
+        values, line_numbers, contexts = self.extract_amount_arrays(text, line_index)
+        return [self._amount_info(values, line_numbers, contexts, idx) for idx in range(len(values))]
+
+    def _total_index(self, values: np.ndarray, line_numbers: np.ndarray,
+                     contexts: List[str]) -> Optional[int]:
+        """Index of the total within the amount arrays (see identify_total)"""
+        if not len(values):
+            return None
+        
+        # Keyword search once per distinct line, using the first amount found on it
+        unique_lines, first_idx = np.unique(line_numbers, return_index=True)
+        keyword_lines = unique_lines[
+            [self.total_re.search(contexts[idx]) is not None for idx in first_idx.tolist()]
+        ]
+        candidates = np.flatnonzero(np.isin(line_numbers, keyword_lines))
+        
+        if len(candidates):
+            # Largest amount from total lines (argmax keeps the first on ties)
+            return int(candidates[np.argmax(values[candidates])])
+        
+        # Fallback: the largest amount overall
+        return int(np.argmax(values))
+
+    def identify_total(self, amounts: List[AmountInfo], text: str,
+                       lines: Optional[List[str]] = None) -> Optional[AmountInfo]:
+        """Identify the total amount from the list of amounts (lines: the already split text)"""
+        if lines is None:
+            lines = [line.strip() for line in text.splitlines() if line.strip()]
+        
+        # Group amounts by line once instead of rescanning them for every keyword line
+        amounts_by_line = defaultdict(list)
+        for amt in amounts:
+            amounts_by_line[amt.line_number].append(amt)
+        
+        # Look for amounts in lines with total keywords (only lines that hold an amount)
+        keyword_lines = {
+            line_idx for line_idx in amounts_by_line
+            if 0 <= line_idx < len(lines) and self.total_re.search(lines[line_idx]) is not None
+        }
+        total_candidates = [amt for line_idx in sorted(keyword_lines) for amt in amounts_by_line[line_idx]]
         
         if total_candidates:
             # Return the largest amount from total lines
@@ -289,26 +780,34 @@ class TextProcessor:
 
     def verify_calculations(self, text: str) -> VerificationResult:
         """Verify if the sum of items matches the total"""
-        amounts = self.extract_amounts(text)
-        total = self.identify_total(amounts, text)
+        values, line_numbers, contexts = self.extract_amount_arrays(text)
+        total_idx = self._total_index(values, line_numbers, contexts)
         
         # Filter out the total from items
-        items = []
-        if total:
-            items = [amt for amt in amounts if amt.value != total.value or amt.line_number != total.line_number]
+        if total_idx is not None:
+            total = self._amount_info(values, line_numbers, contexts, total_idx)
+            total_cents = int(values[total_idx])
+            item_idx = np.flatnonzero(
+                (values != total_cents) | (line_numbers != line_numbers[total_idx])
+            )
         else:
-            items = amounts
+            total = None
+            item_idx = np.arange(len(values))
         
-        # Calculate sum
-        calculated_sum = sum(item.value for item in items)
+        items = [self._amount_info(values, line_numbers, contexts, idx) for idx in item_idx.tolist()]
+        
+        # Calculate sum (in cents over the contiguous array)
+        sum_cents = int(values[item_idx].sum())
+        calculated_sum = _cents_to_decimal(sum_cents) if items else Decimal('0')
         
         # Check if calculations match
         matches = False
         difference = Decimal('0')
         
         if total:
-            difference = abs(calculated_sum - total.value)
-            matches = difference <= Decimal('0.02')  # 2 cent tolerance
+            difference_cents = abs(sum_cents - total_cents)
+            matches = difference_cents <= TOLERANCE_CENTS
+            difference = _cents_to_decimal(difference_cents)
         
         return VerificationResult(
             items=items,
@@ -319,26 +818,113 @@ class TextProcessor:
         )
 
 
+# Worker-local OCRApp for process pools (here and in batch_processor), built once per process by _init_worker
+_WORKER_APP: Optional["OCRApp"] = None
+
+
+def _init_worker(tesseract_path: Optional[str], google_credentials_path: Optional[str],
+                 cache_size: int = 128, cache_dir: Optional[str] = None):
+    """ProcessPoolExecutor initializer: build the worker's OCRApp once, with the parent's cache settings"""
+    global _WORKER_APP
+    _WORKER_APP = OCRApp(tesseract_path, google_credentials_path, cache_size, cache_dir)
+
+
+def _process_image_in_worker(image_path: str, engine: OCREngine) -> Dict[str, Any]:
+    """Process one image with the worker-local OCRApp"""
+    return _WORKER_APP.process_image(image_path, engine)
+
+
+def _content_hash(data: bytes) -> str:
+    """Hex digest identifying an image by its file content"""
+    if BLAKE3_AVAILABLE:
+        return blake3.blake3(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
 class OCRApp:
     """Main OCR Application Class"""
     
-    def __init__(self, tesseract_path: str = None, google_credentials_path: str = None):
+    def __init__(self, tesseract_path: str = None, google_credentials_path: str = None,
+                 cache_size: int = 128, cache_dir: Optional[str] = None):
         self.engine_manager = OCREngineManager(tesseract_path, google_credentials_path)
         self.text_processor = TextProcessor()
+        
+        # Results keyed by (content hash, engine): identical images are only OCR'd once.
+        # cache_dir persists them with diskcache when installed; otherwise an in-memory LRU.
+        self.cache_size = cache_size
+        self.cache_dir = cache_dir
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._disk_cache = diskcache.Cache(cache_dir) if cache_dir and DISKCACHE_AVAILABLE else None
+    
+    def _cache_get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Cached result for key (a fresh dict, so callers may annotate it), or None"""
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+        if result is None and self._disk_cache is not None:
+            result = self._disk_cache.get(key)
+        return dict(result) if result is not None else None
+    
+    def _cache_put(self, key: Tuple[str, str], result: Dict[str, Any]):
+        """Store a successful result"""
+        if self.cache_size <= 0 and self._disk_cache is None:
+            return
+        with self._cache_lock:
+            self._cache[key] = dict(result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        if self._disk_cache is not None:
+            try:
+                self._disk_cache[key] = dict(result)
+            except Exception:
+                # Some raw engine payloads cannot be pickled; keep them in memory only
+                pass
+    
+
+    def process_image(self, image_path: Union[str, os.PathLike, List[str], Tuple[str, ...]],
+                      engine: OCREngine = OCREngine.TESSERACT) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Process an image and return comprehensive results (a list or tuple of paths goes to process_batch)"""
+        if isinstance(image_path, (list, tuple)):
+            return self.process_batch(list(image_path), engine)
+        
+        try:
+            # Load image (the file is read once; Vision gets these bytes without re-encoding)
+            if hasattr(image_path, 'read'):
+                image_bytes = image_path.read()
+            else:
+                with open(image_path, 'rb') as f:
+                    image_bytes = f.read()
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'ocr_result': None,
+                'verification': None
+            }
+        
+        return self.process_image_from_bytes(image_bytes, engine)
     
-    def process_image(self, image_path: str, engine: OCREngine = OCREngine.TESSERACT) -> Dict[str, Any]:
-        """Process an image and return comprehensive results"""
+    def process_image_from_bytes(self, image_bytes: bytes, engine: OCREngine = OCREngine.TESSERACT) -> Dict[str, Any]:
+        """Process an in-memory encoded image (e.g. an upload) and return comprehensive results"""
         try:
-            # Load image
-            image = Image.open(image_path)
+            # Same content and engine as an earlier call: reuse that result
+            cache_key = (_content_hash(image_bytes), engine.value)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+            
+            image = Image.open(io.BytesIO(image_bytes))
             
             # Extract text
-            ocr_result = self.engine_manager.extract_text(image, engine)
+            ocr_result = self.engine_manager.extract_text(image, engine, image_bytes=image_bytes)
             
             # Process text for financial verification
             verification = self.text_processor.verify_calculations(ocr_result.text)
             
-            return {
+            result = {
                 'success': True,
                 'ocr_result': ocr_result,
                 'verification': verification,
@@ -348,6 +934,10 @@ class OCRApp:
                     'format': image.format
                 }
             }
+            # Engine errors come back as empty text; don't pin those
+            if ocr_result.text:
+                self._cache_put(cache_key, result)
+            return result
             
         except Exception as e:
             return {
@@ -357,23 +947,158 @@ class OCRApp:
                 'verification': None
             }
     
-    def compare_engines(self, image_path: str) -> Dict[str, Any]:
-        """Compare results from both OCR engines"""
-        results = {}
-        
-        # Test Tesseract
-        try:
-            results['tesseract'] = self.process_image(image_path, OCREngine.TESSERACT)
-        except Exception as e:
-            results['tesseract'] = {'success': False, 'error': str(e)}
+    def _worker_initargs(self) -> Tuple[Optional[str], Optional[str], int, Optional[str]]:
+        """_init_worker arguments reproducing this app's configuration in a worker process.
+
+        Workers keep their own in-memory LRU; with cache_dir they all share the disk cache.
+        """
+        return (self.engine_manager.tesseract_path, self.engine_manager.google_credentials_path,
+                self.cache_size, self.cache_dir)
+    
+    def process_batch(self, image_paths: List[str], engine: OCREngine = OCREngine.TESSERACT) -> List[Dict[str, Any]]:
+        """Process several images, with one Tesseract invocation (or batched Vision requests) for the list.
+
+        Cached results are reused and duplicate images are OCR'd once; only the rest go
+        to the engine.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(image_paths)
+        pending: Dict[Tuple[str, str], List[int]] = {}
         
-        # Test Google Vision (if available)
-        if GOOGLE_VISION_AVAILABLE:
+        for idx, image_path in enumerate(image_paths):
             try:
-                results['google_vision'] = self.process_image(image_path, OCREngine.GOOGLE_VISION)
+                with open(image_path, 'rb') as f:
+                    cache_key = (_content_hash(f.read()), engine.value)
             except Exception as e:
-                results['google_vision'] = {'success': False, 'error': str(e)}
+                results[idx] = {
+                    'success': False,
+                    'error': str(e),
+                    'ocr_result': None,
+                    'verification': None
+                }
+                continue
+            
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                results[idx] = cached
+            else:
+                pending.setdefault(cache_key, []).append(idx)
+        
+        uncached = self._process_uncached_batch([image_paths[idxs[0]] for idxs in pending.values()], engine)
+        for (cache_key, idxs), result in zip(pending.items(), uncached):
+            # Engine errors come back as empty text; don't pin those
+            if result['success'] and result['ocr_result'].text:
+                self._cache_put(cache_key, result)
+            for n, idx in enumerate(idxs):
+                results[idx] = result if n == 0 else dict(result)
+        
+        return results
+    
+    def _process_uncached_batch(self, image_paths: List[str], engine: OCREngine) -> List[Dict[str, Any]]:
+        """Run the engine over the list in as few calls as possible.
+
+        Falls back to one process_image call per image if the batch run fails.
+        """
+        if engine == OCREngine.GOOGLE_VISION and GOOGLE_VISION_AVAILABLE and len(image_paths) > 1:
+            try:
+                return [
+                    result
+                    for start in range(0, len(image_paths), VISION_BATCH_SIZE)
+                    for result in self._process_vision_batch(image_paths[start:start + VISION_BATCH_SIZE])
+                ]
+            except Exception:
+                pass
+        
+        if engine == OCREngine.TESSERACT and len(image_paths) > 1:
+            try:
+                ocr_results = self.engine_manager.extract_text_tesseract_batch(image_paths)
+            except (OSError, subprocess.CalledProcessError, ValueError):
+                ocr_results = None
+            
+            if ocr_results is not None:
+                results = []
+                for image_path, ocr_result in zip(image_paths, ocr_results):
+                    # Image.open only parses the header here
+                    with Image.open(image_path) as image:
+                        image_info = {'size': image.size, 'mode': image.mode, 'format': image.format}
+                    results.append({
+                        'success': True,
+                        'ocr_result': ocr_result,
+                        'verification': self.text_processor.verify_calculations(ocr_result.text),
+                        'image_info': image_info
+                    })
+                return results
+        
+        return [self.process_image(image_path, engine) for image_path in image_paths]
+    
+    def _process_vision_batch(self, image_paths: List[str]) -> List[Dict[str, Any]]:
+        """Process up to VISION_BATCH_SIZE images with a single Vision request"""
+        image_bytes = []
+        for image_path in image_paths:
+            with open(image_path, 'rb') as f:
+                image_bytes.append(f.read())
+        images = [Image.open(io.BytesIO(data)) for data in image_bytes]
+        try:
+            ocr_results = self.engine_manager.extract_text_google_vision_batch(images, image_bytes)
+            return [
+                {
+                    'success': True,
+                    'ocr_result': ocr_result,
+                    'verification': self.text_processor.verify_calculations(ocr_result.text),
+                    'image_info': {'size': image.size, 'mode': image.mode, 'format': image.format}
+                }
+                for image, ocr_result in zip(images, ocr_results)
+            ]
+        finally:
+            for image in images:
+                image.close()
+    
+    def process_batch_parallel(self, image_paths: List[str], engine: OCREngine = OCREngine.TESSERACT,
+                               max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Process images in parallel, one image per task, results in input order.
+
+        Tesseract is CPU-bound and runs in worker processes (about 4 cores per process by
+        default); Google Vision is network-bound and runs in threads.
+        """
+        if not image_paths:
+            return []
+        
+        if engine == OCREngine.TESSERACT:
+            workers = max_workers or max(1, (os.cpu_count() or 1) // 4)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=self._worker_initargs()
+            ) as executor:
+                return list(executor.map(_process_image_in_worker, image_paths, [engine] * len(image_paths)))
+        
+        workers = max_workers or min(32, len(image_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.process_image, image_paths, [engine] * len(image_paths)))
+    
+    def compare_engines(self, image_path: Optional[str] = None, image_bytes: Optional[bytes] = None) -> Dict[str, Any]:
+        """Compare results from both OCR engines (on a file, or on in-memory image_bytes)"""
+        results = {}
+        if image_bytes is not None:
+            process, source = self.process_image_from_bytes, image_bytes
         else:
+            process, source = self.process_image, image_path
+        
+        # Run both engines at once: Tesseract is CPU-bound and Vision waits on the network,
+        # and both release the GIL while they work
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {'tesseract': executor.submit(process, source, OCREngine.TESSERACT)}
+            
+            # Test Google Vision (if available)
+            if GOOGLE_VISION_AVAILABLE:
+                futures['google_vision'] = executor.submit(process, source, OCREngine.GOOGLE_VISION)
+            
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    results[name] = {'success': False, 'error': str(e)}
+        
+        if not GOOGLE_VISION_AVAILABLE:
             results['google_vision'] = {'success': False, 'error': 'Google Cloud Vision not available'}
         
         return results
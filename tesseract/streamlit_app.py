@@ -51,6 +51,11 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource(show_spinner=False)
+def _make_ocr_app(tesseract_path: str, google_creds: str) -> OCRApp:
+    """Build the OCRApp once per configuration and share it across reruns and sessions"""
+    return OCRApp(tesseract_path, google_creds)
+
 def initialize_app():
     """Initialize the OCR application"""
     if 'ocr_app' not in st.session_state:
@@ -72,7 +77,7 @@ def initialize_app():
             st.sidebar.warning("Google Cloud credentials file not found")
             google_creds = None
         
-        st.session_state.ocr_app = OCRApp(tesseract_path, google_creds)
+        st.session_state.ocr_app = _make_ocr_app(tesseract_path, google_creds)
 
 def display_ocr_results(ocr_result: OCRResult):
     """Display OCR extraction results"""
@@ -277,49 +282,41 @@ def main():
             )
             
             if st.button("🚀 Procesar Imagen", type="primary"):
-                # Save uploaded file temporarily
-                temp_path = f"temp_{uploaded_file.name}"
-                with open(temp_path, "wb") as f:
-                    f.write(uploaded_file.getbuffer())
+                # Process the upload in memory (no temporary file on disk)
+                image_bytes = uploaded_file.getvalue()
                 
-                try:
-                    if compare_engines and len(available_engines) > 1:
-                        # Compare engines
-                        with st.spinner("Comparando motores OCR..."):
-                            comparison_results = st.session_state.ocr_app.compare_engines(temp_path)
-                        
-                        display_engine_comparison(comparison_results)
+                if compare_engines and len(available_engines) > 1:
+                    # Compare engines
+                    with st.spinner("Comparando motores OCR..."):
+                        comparison_results = st.session_state.ocr_app.compare_engines(image_bytes=image_bytes)
                         
-                        # Show individual results
-                        for engine_name in available_engines:
-                            if engine_name.lower().replace(" ", "_") in comparison_results:
-                                engine_key = engine_name.lower().replace(" ", "_")
-                                result = comparison_results[engine_key]
-                                
-                                if result['success']:
-                                    st.subheader(f"📊 Resultados - {engine_name}")
-                                    display_ocr_results(result['ocr_result'])
-                                    display_verification_results(result['verification'])
-                                    st.divider()
+                    display_engine_comparison(comparison_results)
                     
-                    else:
-                        # Single engine processing
-                        with st.spinner(f"Procesando con {selected_engine}..."):
-                            result = st.session_state.ocr_app.process_image(
-                                temp_path, 
-                                engine_map[selected_engine]
-                            )
-                        
-                        if result['success']:
-                            display_ocr_results(result['ocr_result'])
-                            display_verification_results(result['verification'])
-                        else:
-                            st.error(f"Error al procesar la imagen: {result['error']}")
+                    # Show individual results
+                    for engine_name in available_engines:
+                        if engine_name.lower().replace(" ", "_") in comparison_results:
+                            engine_key = engine_name.lower().replace(" ", "_")
+                            result = comparison_results[engine_key]
+                            
+                            if result['success']:
+                                st.subheader(f"📊 Resultados - {engine_name}")
+                                display_ocr_results(result['ocr_result'])
+                                display_verification_results(result['verification'])
+                                st.divider()
                 
-                finally:
-                    # Clean up temporary file
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
+                else:
+                    # Single engine processing
+                    with st.spinner(f"Procesando con {selected_engine}..."):
+                        result = st.session_state.ocr_app.process_image_from_bytes(
+                            image_bytes, 
+                            engine_map[selected_engine]
+                        )
+                    
+                    if result['success']:
+                        display_ocr_results(result['ocr_result'])
+                        display_verification_results(result['verification'])
+                    else:
+                        st.error(f"Error al procesar la imagen: {result['error']}")
     
     # Sample data section
     st.header("📚 Datos de Ejemplo")